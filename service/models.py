@@ -33,6 +33,7 @@ from enum import Enum
 from decimal import Decimal
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import lambda_stmt, select
 
 logger = logging.getLogger("flask.app")
 
@@ -185,9 +186,16 @@ class Product(db.Model):
         :return: an instance with the product_id, or None if not found
         :rtype: Product
 
+        An unexpired Product already loaded in the current session is returned
+        from its identity map without a query. Instances expired by a commit
+        are refreshed with a SELECT
+
         """
         logger.info("Processing lookup for id %s ...", product_id)
-        return cls.query.get(product_id)
+        return db.session.get(cls, product_id)
+
+    # The find_by_* queries below are built with lambda_stmt() so each statement
+    # is constructed and compiled once and only the bound values change
 
     @classmethod
     def find_by_name(cls, name: str) -> list:
@@ -201,7 +209,9 @@ class Product(db.Model):
 
         """
         logger.info("Processing name query for %s ...", name)
-        return cls.query.filter(cls.name == name)
+        stmt = lambda_stmt(lambda: select(Product))
+        stmt += lambda s: s.where(Product.name == name)
+        return db.session.execute(stmt).scalars().all()
 
     @classmethod
     def find_by_price(cls, price: Decimal) -> list:
@@ -218,7 +228,9 @@ class Product(db.Model):
         price_value = price
         if isinstance(price, str):
             price_value = Decimal(price.strip(' "'))
-        return cls.query.filter(cls.price == price_value)
+        stmt = lambda_stmt(lambda: select(Product))
+        stmt += lambda s: s.where(Product.price == price_value)
+        return db.session.execute(stmt).scalars().all()
 
     @classmethod
     def find_by_availability(cls, available: bool = True) -> list:
@@ -232,7 +244,9 @@ class Product(db.Model):
 
         """
         logger.info("Processing available query for %s ...", available)
-        return cls.query.filter(cls.available == available)
+        stmt = lambda_stmt(lambda: select(Product))
+        stmt += lambda s: s.where(Product.available == available)
+        return db.session.execute(stmt).scalars().all()
 
     @classmethod
     def find_by_category(cls, category: Category = Category.UNKNOWN) -> list:
@@ -246,4 +260,6 @@ class Product(db.Model):
 
         """
         logger.info("Processing category query for %s ...", category.name)
-        return cls.query.filter(cls.category == category)
+        stmt = lambda_stmt(lambda: select(Product))
+        stmt += lambda s: s.where(Product.category == category)
+        return db.session.execute(stmt).scalars().all()
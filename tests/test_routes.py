@@ -17,12 +17,11 @@
 Product API Service Test Suite
 
 Test cases can be run with the following:
-  nosetests -v --with-spec --spec-color
-  coverage report -m
+  pytest
   codecov --token=$CODECOV_TOKEN
 
   While debugging just these tests it's convenient to use this:
-    nosetests --stop tests/test_service.py:TestProductService
+    pytest -x tests/test_routes.py::TestProductRoutes
 """
 import os
 import logging